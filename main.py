@@ -1,20 +1,118 @@
-from bs4 import BeautifulSoup
+import lxml.html
 from selenium import webdriver
-from selenium.common import NoSuchElementException
+from selenium.common import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 import time
 import json
+import os
+import gzip
+import hashlib
+import argparse
 import random
 import logging
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlencode
+import requests
 from webdriver_manager.chrome import ChromeDriverManager
 from anticaptchaofficial.recaptchav2proxyless import *
 from googlesearch import search
 
 logging.basicConfig(level=logging.INFO)
 
+SUBMIT_BUTTON_LOCATOR = (By.CSS_SELECTOR, "button[type='submit']")
+APPLY_FORM_LOCATOR = (By.CSS_SELECTOR, "form[data-testid='ApplyStep1Form']")
+APPLY_BUTTON_LOCATOR = (By.CSS_SELECTOR, "form[data-testid='ApplyStep1Form'] button[type='submit']")
+ONE_PAGER_FORM_LOCATOR = (By.CSS_SELECTOR, "form#OnePagerForm")
+RECAPTCHA_ERROR_LOCATOR = (By.XPATH, "//div[contains(text(), 'Recaptcha token is invalid')]")
+PAGE_WAIT_TIMEOUT = 25
+
+CHROME_PROFILES_DIR = os.path.expanduser("~/.jobgenie/chrome")
+PROFILE_NAME_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+
+GOOGLE_SEARCH_URL = "http://www.google.com/search"
+# Google ignores num= and serves 10 results per page; pages are fetched concurrently.
+SEARCH_PAGES = 2
+RESULTS_PER_PAGE = 10
+SEARCH_RESULT_CLASS = "yuRUbf"
+JOB_URL_FILTER = "join.com/companies"
+# href of the first link inside each result block, kept only when it points at a job page.
+# Both the block match and the URL filter run inside libxml2.
+SEARCH_RESULT_LINK_XPATH = (f"//div[contains(concat(' ', normalize-space(@class), ' '), ' {SEARCH_RESULT_CLASS} ')]"
+                            f"/descendant::a[1][contains(@href, '{JOB_URL_FILTER}')]/@href")
+SEARCH_QUERY_WORKERS = 3
+
+# Result pages are cached on disk for repeat runs. Google marks them max-age=0, so a fixed
+# TTL is used instead of Cache-Control. Only search pages are cached, never job pages.
+SEARCH_CACHE_DIR = os.path.join(".cache", "serp")
+SEARCH_CACHE_TTL = 3600
+SEARCH_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/129.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/129.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/129.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_6) AppleWebKit/605.1.15 (KHTML, like Gecko) "
+    "Version/17.6 Safari/605.1.15",
+)
+
+# Reads every question's text and answer container in one round-trip.
+GET_QUESTIONS_JS = """
+return Array.from(arguments[0].querySelectorAll("div[data-testid='QuestionItem']")).map(question => ({
+    text: question.querySelector('span')?.innerText || '',
+    field: question.querySelector("div[data-testid='QuestionAnswer']"),
+}));
+"""
+
+# Fills every collected answer in one round-trip. Text inputs go through the native
+# value setter plus input/change events so React-controlled fields pick the value up.
+FILL_ANSWERS_JS = """
+const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+for (const answer of arguments[0]) {
+    if (answer.kind === 'choice') {
+        const option = answer.field.querySelector(`div[data-testid='${answer.value}Answer']`);
+        if (option) option.click();
+        continue;
+    }
+    const input = answer.field.querySelector("input[type='text']");
+    if (!input) continue;
+    setValue.call(input, answer.value);
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+}
+"""
+
+# (keywords, config key, default answer, answer kind). "choice" answers click the
+# matching Yes/No option, "text" answers are written into the question's text input.
+QUESTION_RULES = (
+    (("reside in", "currently legally permitted to work in"), "reside_in_barcelona", "No", "choice"),
+    (("available to start",), "start_date", "", "text"),
+    (("expected yearly compensation",), "expected_compensation", "", "text"),
+    (("level of proficiency in English",), "english_proficiency", "Professional working proficiency", "text"),
+    (("level of proficiency in",), "german_proficiency", "None", "text"),
+    (("require sponsorship for employment visa status",), "require_sponsorship", "Yes", "choice"),
+    (("years of work experience in",), "react_experience", "3", "text"),
+    (("city do you currently live in",), "current_city", "Lahore, Pakistan", "text"),
+    (("comfortable working in a remote",), "remotely_available", "Yes", "text"),
+)
+# One alternation over every keyword; the named group that matched indexes QUESTION_RULES.
+# It is wrapped in a lookahead so finditer reports a match at every position where some
+# keyword starts, and at each position the alternatives are tried in rule order. Taking the
+# lowest index over all matches keeps the old if/elif priority: the earliest rule wins
+# wherever its keyword appears, and "... in English" still beats "level of proficiency in".
+QUESTION_PATTERN = re.compile("(?=" + "|".join(
+    f"(?P<rule{index}>{'|'.join(map(re.escape, keywords))})"
+    for index, (keywords, *_) in enumerate(QUESTION_RULES)
+) + ")")
+
 
 # Check if the resume is already uploaded
 # uploaded_icon = form.find_element(By.XPATH, ".//i[@data-testid='attachment-uploaded-icon']")
@@ -29,53 +127,185 @@ logging.basicConfig(level=logging.INFO)
 
 
 class JobApplicationBot:
-    def __init__(self, driver_path, cookies_file):
+    def __init__(self, driver_path, cookies_file, profile_name="default", headless=True,
+                 search_cache_ttl=SEARCH_CACHE_TTL):
+        if not PROFILE_NAME_PATTERN.fullmatch(profile_name):
+            raise ValueError(f"Invalid Chrome profile name: {profile_name!r}")
         self.driver_path = driver_path
         self.cookies_file = cookies_file
         self.chrome_options = Options()
-        # self.chrome_options.add_argument("--headless")
+        if headless:
+            self.chrome_options.add_argument("--headless=new")
         self.chrome_options.add_argument("--no-sandbox")
         self.chrome_options.add_argument("--disable-dev-shm-usage")
+        self.chrome_options.add_argument("--disable-gpu")
+        self.chrome_options.add_argument("--disable-extensions")
+        self.chrome_options.add_argument("--disable-infobars")
+        self.chrome_options.add_argument("--disable-popup-blocking")
+        # Only forms are driven, so skip images and notification prompts.
+        self.chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        self.chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        # Return from get() once the DOM is ready; every lookup afterwards is waited on explicitly.
+        self.chrome_options.page_load_strategy = "eager"
+        # A persistent profile keeps the logged-in session between runs. Chrome locks a
+        # user-data-dir, so every concurrently running bot needs its own profile name.
+        self.chrome_options.add_argument(f"--user-data-dir={os.path.join(CHROME_PROFILES_DIR, profile_name)}")
+        self.chrome_options.add_argument("--profile-directory=Default")
         self.driver = None
+        self.wait = None
+        self.session = requests.Session()
+        self.search_cache_ttl = search_cache_ttl
+        # Queries may be searched from several threads; only one may drive Chrome at a time.
+        self._driver_lock = threading.Lock()
+        self.applied_urls = self._load_applied_urls()
+        self._applied_file = None
+        with open(self.cookies_file, 'r') as file:
+            self.cookies = [self._to_cdp_cookie(cookie) for cookie in json.load(file)]
+        with open('config.json', 'r') as file:
+            self.config = json.load(file)
+
+    def __enter__(self):
+        # Line-buffered so each record reaches the OS as soon as it is written, and a worker
+        # killed mid-run does not re-submit those applications on the next run.
+        self._applied_file = open('applied.txt', 'a', buffering=1)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._quit_driver()
+        self.session.close()
+        # Make sure this run's applications reach the disk before the bot goes away.
+        os.fsync(self._applied_file.fileno())
+        self._applied_file.close()
 
     def _initialize_driver(self):
+        if self.driver is not None:
+            return
         service = Service(self.driver_path)
         self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
+        self.driver.implicitly_wait(0)
+        self.wait = WebDriverWait(self.driver, PAGE_WAIT_TIMEOUT)
 
     def _quit_driver(self):
         if self.driver:
             self.driver.quit()
+            self.driver = None
+            self.wait = None
+
+    @staticmethod
+    def _to_cdp_cookie(cookie):
+        cdp_cookie = {key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly")
+                      if key in cookie}
+        if "sameSite" in cookie:
+            same_site = cookie["sameSite"]
+            cdp_cookie["sameSite"] = same_site if same_site in ["Strict", "Lax", "None"] else "Lax"
+        expires = cookie.get("expiry", cookie.get("expirationDate"))
+        if expires is not None:
+            cdp_cookie["expires"] = float(expires)
+        return cdp_cookie
+
+    def _load_cookies(self):
+        # One DevTools call sets the whole jar instead of one add_cookie round-trip per cookie.
+        try:
+            self.driver.execute_cdp_cmd('Network.setCookies', {'cookies': self.cookies})
+            return
+        except WebDriverException as e:
+            logging.info(f"Bulk cookie injection failed, setting cookies one by one. Error: {e}")
+        # One malformed cookie rejects the whole batch; set them individually and skip the bad ones.
+        for cookie in self.cookies:
+            try:
+                self.driver.execute_cdp_cmd('Network.setCookie', cookie)
+            except WebDriverException as e:
+                logging.info(f"Could not set cookie {cookie.get('name')}. Error: {e}")
 
-    def search_jobs_on_google(self, query):
-
+    def _load_applied_urls(self):
         try:
-            job_urls = []
             with open('applied.txt', 'r') as file:
-                applied_urls = file.read().splitlines()
-            try:
-                job_urls = [
-                    # url for url in search(query, num=100, stop=100, pause=3, tbs='qdr:d')
-                    # if 'join.com/companies' in url and url not in applied_urls
-                ]
-            except:
-                pass
-            
-            if not job_urls:
-                self._initialize_driver()
-                n_pages = 3
-                for page in range(1, n_pages):
-                    url = "http://www.google.com/search?q=" + query + "&start=" + str((page - 1) * 10)
-                    self.driver.get(url)
-                    soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                    # soup = BeautifulSoup(r.text, 'html.parser')
-
-                    searches = soup.find_all('div', class_="yuRUbf")
-                    for h in searches:
-                        if 'join.com/companies' in h.a.get('href') and h.a.get('href') not in applied_urls:
-                            job_urls.append(h.a.get('href'))
-            return job_urls
-        finally:
-            self._quit_driver()
+                return set(file.read().splitlines())
+        except OSError:
+            return set()
+
+    def _record_applied(self, job_url):
+        self.applied_urls.add(job_url)
+        self._applied_file.write(f"{job_url}\n")
+
+    def _search_cache_path(self, url):
+        return os.path.join(SEARCH_CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + ".html.gz")
+
+    def _read_cached_search_page(self, url):
+        if not self.search_cache_ttl:
+            return None
+        path = self._search_cache_path(url)
+        try:
+            if time.time() - os.path.getmtime(path) > self.search_cache_ttl:
+                return None
+            with gzip.open(path, 'rt', encoding='utf-8') as file:
+                return file.read()
+        except OSError:
+            return None
+
+    def _write_cached_search_page(self, url, page_source):
+        if not self.search_cache_ttl or SEARCH_RESULT_CLASS not in page_source:
+            return
+        os.makedirs(SEARCH_CACHE_DIR, exist_ok=True)
+        path = self._search_cache_path(url)
+        with gzip.open(path + ".tmp", 'wt', encoding='utf-8') as file:
+            file.write(page_source)
+        os.replace(path + ".tmp", path)
+
+    def _fetch_search_page(self, url):
+        cached = self._read_cached_search_page(url)
+        if cached is not None:
+            return cached
+        try:
+            response = self.session.get(url, headers={"User-Agent": random.choice(SEARCH_USER_AGENTS)},
+                                        timeout=10)
+        except requests.RequestException as e:
+            logging.info(f"Plain HTTP search failed for {url}. Error: {e}")
+            return None
+        # Consent pages, captcha walls and JS-only result pages have no result blocks;
+        # those are left to the browser.
+        if not response.ok or SEARCH_RESULT_CLASS not in response.text:
+            return None
+        self._write_cached_search_page(url, response.text)
+        return response.text
+
+    def iter_jobs(self, query):
+        # Pre-seeded with applied URLs so they and repeats across pages are dropped on insert
+        seen_urls = set(self.applied_urls)
+        page_urls = [
+            f"{GOOGLE_SEARCH_URL}?{urlencode({'q': query, 'start': page * RESULTS_PER_PAGE})}"
+            for page in range(SEARCH_PAGES)
+        ]
+        with ThreadPoolExecutor(max_workers=len(page_urls)) as executor:
+            # map yields pages in order as soon as each one is fetched
+            for url, page_source in zip(page_urls, executor.map(self._fetch_search_page, page_urls)):
+                if page_source is None:
+                    with self._driver_lock:
+                        self._initialize_driver()
+                        self.driver.get(url)
+                        page_source = self.driver.page_source
+                    self._write_cached_search_page(url, page_source)
+                for href in lxml.html.fromstring(page_source).xpath(SEARCH_RESULT_LINK_XPATH):
+                    if href not in seen_urls:
+                        seen_urls.add(href)
+                        yield href
+
+    def search_jobs_on_google(self, query):
+        job_urls = []
+        try:
+            job_urls = [
+                # url for url in search(query, num=100, stop=100, pause=3, tbs='qdr:d')
+                # if JOB_URL_FILTER in url and url not in self.applied_urls
+            ]
+        except Exception as e:
+            logging.info(f"Google search library failed for {query}. Error: {e}")
+
+        if not job_urls:
+            job_urls = list(self.iter_jobs(query))
+        return job_urls
 
     def solve_captcha(self, site_key, url):
         solver = recaptchaV2Proxyless()
@@ -91,121 +321,124 @@ class JobApplicationBot:
             logging.error("Captcha solving failed: " + solver.error_code)
             return None
 
+    def _build_answer(self, question):
+        rule_indexes = [int(match.lastgroup[len("rule"):])
+                        for match in QUESTION_PATTERN.finditer(question["text"])]
+        if not rule_indexes or question["field"] is None:
+            return None
+        _, config_key, default, kind = QUESTION_RULES[min(rule_indexes)]
+        return {"field": question["field"], "kind": kind, "value": str(self.config.get(config_key, default))}
+
     def login_and_apply_to_jobs(self, job_urls):
         self._initialize_driver()
-        with open(self.cookies_file, 'r') as file:
-            cookies = json.load(file)
-        with open('config.json', 'r') as file:
-            config_data = json.load(file)
-        logged_in = False
+        # Cookies carry their domain, so they can be set before navigating and no refresh is needed.
+        # Setting them on every run overwrites stale or revoked ones left in the persistent profile.
+        self._load_cookies()
         for job_url in job_urls:
+            if job_url in self.applied_urls:
+                logging.info(f"Already applied for {job_url}, skipping")
+                continue
             try:
                 self.driver.get(job_url)
 
-                if not logged_in:
-                    for cookie in cookies:
-                        if "sameSite" in cookie and cookie["sameSite"] not in ["Strict", "Lax", "None"]:
-                            cookie["sameSite"] = "Lax"
-                        time.sleep(1)
-                        self.driver.add_cookie(cookie)
-                    self.driver.refresh()
-                    time.sleep(random.uniform(1, 3))
+                self.wait.until(EC.any_of(EC.presence_of_element_located(APPLY_FORM_LOCATOR),
+                                          EC.presence_of_element_located(ONE_PAGER_FORM_LOCATOR)))
 
-                try:
-                    form = self.driver.find_element(By.XPATH, "//form[@data-testid='ApplyStep1Form']")
-                    logged_in = True
-                    apply_button = form.find_element(By.XPATH, ".//button[@type='submit']")
+                # One lookup answers both "is this the apply step?" and "where is its button?";
+                # find_elements returns [] on a miss instead of raising.
+                apply_buttons = self.driver.find_elements(*APPLY_BUTTON_LOCATOR)
+                if apply_buttons:
+                    apply_button = apply_buttons[0]
 
-                    time.sleep(random.uniform(1, 4))
+                    time.sleep(random.uniform(0.5, 1.5))
                     self.driver.execute_script("arguments[0].click();", apply_button)
+                    try:
+                        self.wait.until(EC.presence_of_element_located(ONE_PAGER_FORM_LOCATOR))
+                    except TimeoutException:
+                        apply_button.click()
                     logging.error(f"Applied for the {job_url} successfully")
-
-                    time.sleep(random.uniform(15, 25))
-                except NoSuchElementException:
+                else:
                     logging.info("No Recaptcha error found. Proceeding with application.")
 
                 try:
-                    # time.sleep(random.uniform(15, 25))
-                    form = self.driver.find_element(By.XPATH, "//form[@id='OnePagerForm']")
-                    questions = form.find_elements(By.XPATH, ".//div[@data-testid='QuestionItem']")
-
-                    for question in questions:
-                        question_text = question.find_element(By.XPATH, ".//span").text
-                        answer_field = question.find_element(By.XPATH, ".//div[@data-testid='QuestionAnswer']")
+                    form = self.wait.until(EC.presence_of_element_located(ONE_PAGER_FORM_LOCATOR))
+                    answers = []
+                    for question in self.driver.execute_script(GET_QUESTIONS_JS, form):
+                        answer = self._build_answer(question)
+                        if answer:
+                            answers.append(answer)
+
+                    if answers:
                         time.sleep(random.uniform(1, 3))
+                        self.driver.execute_script(FILL_ANSWERS_JS, answers)
 
-                        if "reside in" in question_text or "currently legally permitted to work in" in question_text:
-                            answer = config_data.get("reside_in_barcelona", "No")
-                            yes_no_field = answer_field.find_element(By.XPATH,
-                                                                     f".//div[@data-testid='{answer}Answer']")
-                            self.driver.execute_script("arguments[0].click();", yes_no_field)
-
-                        elif "available to start" in question_text or "available to start working" in question_text:
-                            start_date = config_data.get("start_date", "")
-                            date_input = answer_field.find_element(By.XPATH, ".//input[@type='text']")
-                            date_input.send_keys(start_date)
-
-                        elif "expected yearly compensation" in question_text:
-                            compensation = config_data.get("expected_compensation", "")
-                            compensation_input = answer_field.find_element(By.XPATH, ".//input[@type='text']")
-                            compensation_input.send_keys(compensation)
-
-                        elif "level of proficiency in English" in question_text:
-                            proficiency = config_data.get("english_proficiency", "Professional working proficiency")
-                            proficiency_input = answer_field.find_element(By.XPATH, ".//input[@type='text']")
-                            proficiency_input.send_keys(proficiency)
-
-                        elif "level of proficiency in" in question_text:
-                            proficiency = config_data.get("german_proficiency", "None")
-                            proficiency_input = answer_field.find_element(By.XPATH, ".//input[@type='text']")
-                            proficiency_input.send_keys(proficiency)
-
-                        elif "require sponsorship for employment visa status" in question_text:
-                            sponsorship = config_data.get("require_sponsorship", "Yes")
-                            yes_no_field = answer_field.find_element(By.XPATH,
-                                                                     f".//div[@data-testid='{sponsorship}Answer']")
-                            self.driver.execute_script("arguments[0].click();", yes_no_field)
-
-                        elif "years of work experience in" in question_text:
-                            experience = config_data.get("react_experience", "3")
-                            experience_input = answer_field.find_element(By.XPATH, ".//input[@type='text']")
-                            experience_input.send_keys(experience)
-
-                        elif "city do you currently live in" in question_text:
-                            experience = config_data.get("current_city", "Lahore, Pakistan")
-                            experience_input = answer_field.find_element(By.XPATH, ".//input[@type='text']")
-                            experience_input.send_keys(experience)
-
-                        elif "comfortable working in a remote" in question_text:
-                            experience = config_data.get("remotely_available", "Yes")
-                            experience_input = answer_field.find_element(By.XPATH, ".//input[@type='text']")
-                            experience_input.send_keys(experience)
-
-                    submit_button = form.find_element(By.XPATH, ".//button[@type='submit']")
+                    submit_button = form.find_element(*SUBMIT_BUTTON_LOCATOR)
+                    submitted_from = self.driver.current_url
                     self.driver.execute_script("arguments[0].click();", submit_button)
-                    with open("applied.txt", "a") as file:
-                        file.write(f"{job_url}\n")
 
-                    time.sleep(random.uniform(1, 3))
-                except Exception as e:
+                    # Settle as soon as the form is replaced, the page navigates or the captcha is rejected.
+                    settled = False
+                    try:
+                        self.wait.until(EC.any_of(EC.staleness_of(form),
+                                                  EC.url_changes(submitted_from),
+                                                  EC.presence_of_element_located(RECAPTCHA_ERROR_LOCATOR)))
+                        settled = True
+                    except TimeoutException:
+                        logging.info(f"No confirmation after submitting the application for {job_url}")
+
+                    if self.driver.find_elements(*RECAPTCHA_ERROR_LOCATOR):
+                        logging.info(f"Recaptcha token was rejected for {job_url}")
+                    elif settled:
+                        self._record_applied(job_url)
+                except WebDriverException as e:
                     time.sleep(random.uniform(1, 3))
                     logging.info(f"Could not complete application for {job_url}. Error: {e}")
-            except Exception as e:
+            except WebDriverException as e:
                 time.sleep(random.uniform(1, 3))
                 logging.info(f"Could not complete application for {job_url}. Error: {e}")
 
 
+def apply_to_shard(shard_args):
+    driver_path, cookies_file, profile_name, job_urls = shard_args
+    with JobApplicationBot(driver_path, cookies_file, profile_name) as bot:
+        bot.login_and_apply_to_jobs(job_urls)
+
+
+def apply_to_jobs_in_parallel(driver_path, cookies_file, job_urls):
+    # One Chrome per process: WebDriver sessions are not thread-safe.
+    n_workers = max(1, min(os.cpu_count() or 1, len(job_urls) // 4))
+    shards = [(driver_path, cookies_file, f"shard-{i}", job_urls[i::n_workers]) for i in range(n_workers)]
+    # Spawn rather than fork so workers never inherit thread or lock state from the parent.
+    with multiprocessing.get_context("spawn").Pool(n_workers) as pool:
+        pool.map(apply_to_shard, shards)
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--no-cache", action="store_true", help="fetch Google result pages fresh, ignoring .cache/")
+    args = parser.parse_args()
+
     cookies_file_path = "cookies.json"
-    bot = JobApplicationBot(ChromeDriverManager().install(), cookies_file_path)
+    driver_path = ChromeDriverManager().install()
     job_search_queres = ['software engineer python site:join.com', 'software engineer angular site:join.com',
                          'software engineer django site:join.com', 'Full Stack Developer site:join.com',
                          'Frontend Engineer site:join.com', 'Backend Engineer site:join.com']
-    for job_search_query in job_search_queres:
-        try:
-            job_urls = bot.search_jobs_on_google(job_search_query)
-            print(job_urls)
-            bot.login_and_apply_to_jobs(job_urls)
-            time.sleep(random.uniform(10, 30))
-        except:
-            pass
+    search_cache_ttl = 0 if args.no_cache else SEARCH_CACHE_TTL
+    with JobApplicationBot(driver_path, cookies_file_path, profile_name="search",
+                           search_cache_ttl=search_cache_ttl) as bot, \
+            ThreadPoolExecutor(max_workers=SEARCH_QUERY_WORKERS) as executor:
+        futures = {executor.submit(bot.search_jobs_on_google, query): query for query in job_search_queres}
+        # The same listing often matches several queries; collect everything first so each
+        # job page is loaded once, keeping discovery order.
+        all_job_urls = {}
+        for future in as_completed(futures):
+            job_search_query = futures[future]
+            try:
+                job_urls = future.result()
+                print(job_urls)
+                all_job_urls.update(dict.fromkeys(job_urls))
+            except Exception as e:
+                logging.error(f"Could not process query {job_search_query}. Error: {e}")
+
+    if all_job_urls:
+        apply_to_jobs_in_parallel(driver_path, cookies_file_path, list(all_job_urls))